@@ -3,24 +3,35 @@
 
 from direct.directnotify.DirectNotifyGlobal import directNotify
 import importlib as __importlib
+import types as __types
+import sys as __sys
+import concurrent.futures as __futures
 
 __bootstrap_notify = directNotify.newCategory('bootstrap')
+__empty_meta = __types.MappingProxyType({})
+__max_import_workers = 8
 
-def create_class_entry(object_path: str, meta: dict = {}) -> tuple:
+def create_class_entry(object_path: str, meta: dict = None) -> tuple:
     """
     Creates a class entry for use with the bootstrap function
     """
 
+    if meta is None:
+        meta = __empty_meta
+
     parts = object_path.split('.')
     class_name = parts[-1]
 
     return (class_name, object_path, meta)
 
-def create_singleton_entry(object_path: str, meta: dict = {}) -> tuple:
+def create_singleton_entry(object_path: str, meta: dict = None) -> tuple:
     """
     Creates a singleton entry for use with the bootstrap function
     """
 
+    if meta is None:
+        meta = __empty_meta
+
     parts = object_path.split('.')
     class_name = parts[-1]
     path = '.'.join(parts[:-1])
@@ -36,42 +47,91 @@ def get_class_registry() -> object:
     from panda3d_toolbox.registry import ClassRegistry
     return ClassRegistry.instantiate_singleton()
 
-def __import_module(module_name: str) -> object:
+def __import_modules(module_names: list, module_cache: dict) -> None:
     """
-    Imports the requested module by its module
-    name import path
+    Imports the requested modules into the module cache. Modules that have
+    not been imported yet are imported in parallel as imports are largely
+    file system bound
     """
 
-    assert module_name != ''
-    assert module_name != None
+    pending = []
+    for module_name in module_names:
+        if module_name in module_cache or module_name in pending:
+            continue
+
+        module = __sys.modules.get(module_name)
+        if module is not None:
+            module_cache[module_name] = module
+        else:
+            pending.append(module_name)
 
-    components = module_name.split('.')
-    module_path = '.'.join(components[:-1])
-    module = __importlib.import_module(module_path)
+    if len(pending) == 1:
+        module_cache[pending[0]] = __importlib.import_module(pending[0])
+    elif pending:
+        max_workers = min(__max_import_workers, len(pending))
+        with __futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = [(module_name, executor.submit(__importlib.import_module, module_name))
+                for module_name in pending]
 
-    return module
+        for module_name, future in results:
+            module_cache[module_name] = future.result()
 
-def batch_instantiate_singletons(singleton_list: list) -> None:
+def batch_instantiate_singletons(singleton_list: list, cache: dict = None, parallel_imports: bool = False) -> None:
     """
-    Batch instantiates singletons from a list
+    Batch instantiates singletons from a list in their original order. Each singleton's
+    module is imported right before it is instantiated so module level code may depend
+    on previously instantiated singletons. An existing module cache can be supplied to
+    share imported modules with other bootstrap operations.
+
+    If parallel_imports is set all singleton modules are instead imported up front on
+    worker threads. This is only safe for modules that do not depend on previously
+    instantiated singletons at import time and do not import each other circularly
     """
 
+    module_cache = cache if cache is not None else {}
+    class_cache = {}
+
+    if parallel_imports:
+        singleton_list = list(singleton_list)
+        __import_modules([singleton[0] for singleton in singleton_list], module_cache)
+
     for singleton in singleton_list:
         module_name, class_name, args = singleton
-        module_path = '%s.%s' % (module_name, class_name)
-        singleton_module = __import_module(module_path)
-        if singleton_module is None:
-            __bootstrap_notify.warning('Failed to setup singleton: %s. Invalid import' % class_name)
-            continue
 
-        singleton_cls = getattr(singleton_module, class_name)
+        assert module_name != ''
+        assert module_name != None
+
+        singleton_cls = class_cache.get((module_name, class_name))
+        if singleton_cls is None:
+            singleton_module = module_cache.get(module_name)
+            if singleton_module is None:
+                singleton_module = __sys.modules.get(module_name)
+                if singleton_module is None:
+                    singleton_module = __importlib.import_module(module_name)
+
+                module_cache[module_name] = singleton_module
+
+            if singleton_module is None:
+                __bootstrap_notify.warning('Failed to setup singleton: %s. Invalid import' % class_name)
+                continue
+
+            singleton_cls = getattr(singleton_module, class_name)
+            class_cache[(module_name, class_name)] = singleton_cls
+
         singleton_cls.instantiate_singleton(*args)
 
-def bootstrap_module(class_list: list = [], meta_list: list = [], singleton_list: list = []) -> None:
+def bootstrap_module(class_list: list = (), meta_list: list = (), singleton_list: list = (), parallel_imports: bool = False) -> None:
     """
-    Performs initial boostrap operations on a module
+    Performs initial boostrap operations on a module.
+
+    If parallel_imports is set the singleton modules are imported up front on worker
+    threads before any singleton is instantiated. Only enable this when no singleton
+    module depends on a previously instantiated singleton at import time and the
+    singleton modules do not import each other circularly
     """
 
     class_registry = get_class_registry()
-    batch_instantiate_singletons(singleton_list)
-    class_registry.batch_register_classes(class_list, meta_list)
\ No newline at end of file
+    module_cache = {}
+
+    batch_instantiate_singletons(singleton_list, cache=module_cache, parallel_imports=parallel_imports)
+    class_registry.batch_register_classes(class_list, meta_list, module_cache=module_cache)
\ No newline at end of file
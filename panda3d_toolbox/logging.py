@@ -7,10 +7,14 @@ support for Sentry monitoring.
 import os
 import sys
 import time
+import atexit
 import logging
-from io import open as io_open
+import functools
+import threading
+import collections
 from logging import StreamHandler
 
+from direct.directnotify.DirectNotifyGlobal import directNotify
 from panda3d.core import Filename, MultiplexStream, Notify
 from panda3d_toolbox import runtime, prc
 
@@ -21,7 +25,6 @@ def get_notify_categories() -> object:
     Retrieves all Panda3D notifier categories
     """
 
-    from direct.directnotify.DirectNotifyGlobal import directNotify
     return directNotify.getCategories()
 
 def get_notify_category(name: str, create: bool = True) -> object:
@@ -30,10 +33,8 @@ def get_notify_category(name: str, create: bool = True) -> object:
     one if create is set to True
     """
 
-    assert name != None
-    assert name != ''
-
-    from direct.directnotify.DirectNotifyGlobal import directNotify
+    if not name:
+        raise ValueError('Notifier category name must be a non-empty string.')
 
     category = None
     if create:
@@ -42,42 +43,54 @@ def get_notify_category(name: str, create: bool = True) -> object:
         category = directNotify.getCategory(name)
     return category
 
-def log(message: str, name: str = 'global', type: str = 'info') -> None:
+@functools.lru_cache(maxsize=256)
+def _resolve_logger(name: str, type: str) -> object:
     """
-    Writes a message to the requested logger name
+    Returns the bound notifier function for the requested logger
+    name and type. Results are cached to avoid resolving the notifier
+    category on every log call
     """
 
     category = get_notify_category(name)
-    assert hasattr(category, type)
-    getattr(category, type)(message)
 
-def log_error(message: str, name: str = 'global') -> None:
-    """
-    Writes an error message to the requested logger name
-    """
+    # Notifier.error raises after logging instead of printing. Route errors to
+    # the warning level with a level prefix, matching the NotifyHandler
+    if type == 'error':
+        warning = category.warning
+        return lambda message: warning('ERROR: %s' % message)
+
+    func = getattr(category, type, None)
+    if func is None:
+        raise ValueError('Notifier category (%s) has no log type: %s' % (name, type))
 
-    log(name, message, 'error')
+    return func
 
-def log_warn(message: str, name: str = 'global') -> None:
+def log(message: str, name: str = 'global', type: str = 'info') -> None:
     """
-    Writes an warn message to the requested logger name
+    Writes a message to the requested logger name
     """
 
-    log(name, message, 'warn')
+    _resolve_logger(name, type)(message)
 
-def log_info(message: str, name: str = 'global') -> None:
+def _dispatch(type: str, message: str, name: str = 'global') -> None:
     """
-    Writes an info message to the requested logger name
+    Writes a message of the requested type to the requested logger name. Serves
+    as the base of the log_error, log_warn, log_info and log_debug helpers
     """
 
-    log(name, message, 'info')
+    _resolve_logger(name, type)(message)
 
-def log_debug(message: str, name: str = 'global') -> None:
-    """
-    Writes an debug message to the requested logger name
-    """
+log_error = functools.partial(_dispatch, 'error')
+log_error.__doc__ = 'Writes an error message to the requested logger name'
 
-    log(name, message, 'debug')
+log_warn = functools.partial(_dispatch, 'warning')
+log_warn.__doc__ = 'Writes a warning message to the requested logger name'
+
+log_info = functools.partial(_dispatch, 'info')
+log_info.__doc__ = 'Writes an info message to the requested logger name'
+
+log_debug = functools.partial(_dispatch, 'debug')
+log_debug.__doc__ = 'Writes a debug message to the requested logger name'
 
 def condition_error(logger: object, condition: bool, message: str) -> None:
     """
@@ -117,9 +130,14 @@ def condition_log(logger: object, condition: bool, message: str, type: str = 'in
     condition is true using the supplied type attribute function name
     """
 
-    assert hasattr(logger, type)
-    if condition:
-        getattr(logger, type)(message)
+    if not condition:
+        return
+
+    func = getattr(logger, type, None)
+    if func is None:
+        raise ValueError('Logger (%s) has no log type: %s' % (logger, type))
+
+    func(message)
 
 def get_log_directory() -> str:
     """
@@ -130,12 +148,92 @@ def get_log_directory() -> str:
     default = '.%slogs' % os.sep
     return prc.get_prc_string('app-log-directory', default)
 
+class LogFileWriter:
+    """
+    Write-behind log file stream. Messages are encoded and queued in memory
+    and written to the log file from a background thread at a fixed interval.
+    Avoids blocking the caller on file system latency for every write.
+
+    Panda3D writes its notify output to the same file immediately. Python output
+    can therefore land in the file up to one interval after Panda3D output that
+    was written later. The relative order of the two sources in the log file is
+    only accurate to within the interval
+    """
+
+    def __init__(self, path: str, interval: float = 0.05, max_pending: int = 1024):
+        """
+        Initializes the LogFileWriter instance
+        """
+
+        self.path = path
+        self.interval = interval
+        self.max_pending = max_pending
+
+        # Open the file in append mode at the OS level. Append mode seeks to the end
+        # of the file before every write so our writes never overwrite Panda3D's
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        self._fd = os.open(path, flags, 0o644)
+
+        self._pending = collections.deque()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self.__run, name='log-file-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """
+        Queues a message to be written to the log file. The queue is written
+        synchronously once it reaches the pending limit or after the background
+        writer has been stopped
+        """
+
+        self._pending.append(message.encode('utf-8', 'backslashreplace'))
+        if self._stopped.is_set() or len(self._pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all queued messages to the log file
+        """
+
+        with self._lock:
+            chunks = []
+            while self._pending:
+                chunks.append(self._pending.popleft())
+
+            if not chunks:
+                return
+
+            data = memoryview(b''.join(chunks))
+            while data:
+                written = os.write(self._fd, data)
+                data = data[written:]
+
+    def stop(self) -> None:
+        """
+        Stops the background writer thread and writes all queued messages.
+        Messages written afterwards are written to the log file synchronously
+        """
+
+        self._stopped.set()
+        self._thread.join()
+        self.flush()
+
+    def __run(self) -> None:
+        """
+        Background thread loop for writing queued messages
+        """
+
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
 class PythonLogHandler:
     """
-    Redirects native Python logs to a log file
+    Redirects native Python logs to a log file. Writes to the original stream
+    are flushed on line boundaries or after a set number of writes
     """
 
-    def __init__(self, original: object, log_stream: object):
+    def __init__(self, original: object, log_stream: object, flush_every: int = 16):
         """
         Initializes the PythonLogHandler instance
         """
@@ -143,22 +241,28 @@ class PythonLogHandler:
         self.original = original
         self.log_stream = log_stream
 
+        self._buf_count = 0
+        self._flush_every = flush_every
+
     def write(self, message: str) -> None:
         """
         Writes a message to the log file
         """
 
         self.log_stream.write(message)
-        self.log_stream.flush()
-
         self.original.write(message)
-        self.original.flush()
+
+        self._buf_count += 1
+        if message.endswith('\n') or self._buf_count >= self._flush_every:
+            self._buf_count = 0
+            self.original.flush()
 
     def flush(self) -> None:
         """
         Flushes the log stream
         """
 
+        self._buf_count = 0
         self.original.flush()
         self.log_stream.flush()
 
@@ -171,19 +275,21 @@ def configure_log_file() -> None:
     # us to have multiple log files for different application sessions. The resulting
     # filename should be in the format of '{executable}_YYYY-MM-DD_HH-MM-SS.{ext}'
     local_time = time.localtime()
-    log_prefix = runtime.executable_name.lower()
+    log_prefix = runtime.executable_name_lower
     log_suffix = time.strftime('%Y-%m-%d_%H-%M-%S', local_time)
 
     log_ext = prc.get_prc_string('app-log-ext', 'txt')
     log_filename = f"{log_prefix}_{log_suffix}.{log_ext}"
 
-    # Open a new log file stream for appending. 
-    # Make sure to use the 'a' mode (appending) because both Python and Panda3D
-    # open this same filename to write to. Append mode has the nice property of seeking to the end of
-    # the output stream before actually writing to the file. 'w' mode does not do this, so you will see Panda3D's
-    # output and Python's output not interlace properly.
+    # Open a new write-behind log file stream for appending. 
+    # The stream must append because both Python and Panda3D open this same filename to write to.
+    # Append mode has the nice property of seeking to the end of the output stream before actually writing
+    # to the file. Without it you will see Panda3D's output and Python's output not interlace properly.
+    # Python output is written behind by up to the writer's interval, so its ordering relative to
+    # Panda3D's output is only accurate to within that interval.
     log_file_path = os.path.join(get_log_directory(), log_filename)
-    log_stream = io_open(log_file_path, 'a')
+    log_stream = LogFileWriter(log_file_path)
+    atexit.register(log_stream.stop)
 
     # Create new Python log handlers for stdout and stderr and redirect
     # stdout and stderr to these handlers
@@ -204,7 +310,7 @@ def configure_log_file() -> None:
     # Write our log file header with useful information should we ever end up with
     # a log file that needs to be analyzed.
     print("\n\nStarting application...")
-    print(f"Current time: {time.asctime(time.localtime(time.time()))}")
+    print(f"Current time: {time.asctime(local_time)}")
     print(f"sys.path = ", sys.path)
     print(f"sys.argv = ", sys.argv)
     print(f"os.environ = ", os.environ)
@@ -227,39 +333,44 @@ class NotifyHandler(StreamHandler):
 
         self.name = name
         self.notify = get_notify_category(name)
-
-    def emite(self, record: object) -> None:
+        self.setFormatter(logging.Formatter('%(name)s: %(message)s'))
+
+        # Notifier.error raises after logging and the notifier has no critical
+        # level. Route both to the warning level with a level prefix instead
+        self._dispatch = {
+            'debug': (self.notify.debug, ''),
+            'info': (self.notify.info, ''),
+            'warning': (self.notify.warning, ''),
+            'error': (self.notify.warning, 'ERROR: '),
+            'critical': (self.notify.warning, 'CRITICAL: ')
+        }
+
+    def emit(self, record: object) -> None:
         """
         Processes the incoming record from the logging module
         """
 
-        message_parts = self.format(record).split('||')
-        level = message_parts[0].lower()
-        message = message_parts[1]
-        
-        if hasattr(self.notify, level):
-            func = getattr(self.notify, level)
-        else:
-            func = self.notify.info
-        
-        func.info(message)
+        try:
+            func, prefix = self._dispatch.get(record.levelname.lower(), (self.notify.info, ''))
+            func(prefix + self.format(record))
+        except Exception:
+            self.handleError(record)
+
+_notify_level_map = {
+    'spam': logging.DEBUG,
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARN,
+    'error': logging.ERROR
+}
 
 def configure_logging_module() -> None:
     """
     Initializes the Python logging module to pipe through the Panda3D notifier
     """
 
-    level_map = {
-        'spam': logging.DEBUG,
-        'debug': logging.DEBUG,
-        'info': logging.INFO,
-        'warning': logging.WARN,
-        'error': logging.ERROR
-    }
-
-    level = level_map.get(prc.get_prc_string('notify-level-python', ''), logging.INFO)
-    formatter = '%(levelname)s||%(message)s'
-    logging.basicConfig(format=formatter, level=level, handlers=[NotifyHandler()])   
+    level = _notify_level_map.get(prc.get_prc_string('notify-level-python', ''), logging.INFO)
+    logging.basicConfig(level=level, handlers=[NotifyHandler()])
 
 
 # ----------------------------------------------------------------------------------------------- 
@@ -1,6 +1,7 @@
 """
 """
 
+import sys
 import logging
 import importlib
 
@@ -66,9 +67,30 @@ class ClassRegistry(Singleton):
 
         return class_name in self._classes
 
-    def batch_register_classes(self, class_list: list, meta_list: list = []) -> None:
+    def _get_imported_module(self, module_name: str, module_cache: dict = None) -> object:
         """
-        Batch registers classes for module setups
+        Returns the already imported module for the requested module
+        name import path if one exists in the module cache or sys.modules.
+        Otherwise returning NoneType
+        """
+
+        components = module_name.split('.')
+        module_path = '.'.join(components[:-1])
+
+        module = None
+        if module_cache is not None:
+            module = module_cache.get(module_path)
+
+        if module is None:
+            module = sys.modules.get(module_path)
+
+        return module
+
+    def batch_register_classes(self, class_list: list, meta_list: list = [], module_cache: dict = None) -> None:
+        """
+        Batch registers classes for module setups. Classes whose modules are already
+        present in the supplied module cache or sys.modules are registered with
+        their module to avoid importing it again on retrieval
         """
 
         self.notify.debug('Batch registering %d classes...' % len(class_list))
@@ -78,6 +100,12 @@ class ClassRegistry(Singleton):
                 class_name, module_name, str(meta)))
             self.register_class(class_name, module_name, **meta)
 
+            # Attach the module to the registry entry if it has already been imported
+            cls_name, cls_module_name, module, cls_meta = self._classes[class_name]
+            if module is None:
+                module = self._get_imported_module(cls_module_name, module_cache)
+                self._classes[class_name] = (cls_name, cls_module_name, module, cls_meta)
+
         self.notify.debug('Setting %d meta key/values' % (len(meta_list)))
         for meta_info in meta_list:
             class_name, meta_key, meta_value = meta_info
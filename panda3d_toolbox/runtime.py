@@ -1,6 +1,8 @@
 import builtins
 import sys as __sys
 import os as __os
+import functools as __functools
+import importlib.util as __importlib_util
 
 #----------------------------------------------------------------------------------------------------------------------------------#
 
@@ -17,7 +19,17 @@ def __get_base_executable_name() -> str:
     return basename
 
 executable_name = __get_base_executable_name()
+executable_name_lower = executable_name.lower()
 
+# Known runtime variables set by the Application instance. Their has_x, get_x and
+# set_x methods are generated below. Variables without a legacy Panda3d builtin of
+# the same name are declared up front so that access uses the normal module attribute
+# lookup. The others are left undeclared so that attribute access falls back to the
+# builtins provided by the ShowBase instance until they are set
+__runtime_variables = ('base', 'task_mgr', 'loader', 'cam', 'camera', 'window', 'render')
+task_mgr = window = None
+
+@__functools.lru_cache(maxsize=1)
 def is_venv() -> bool:
     """
     Returns true if the application is being run inside
@@ -29,14 +41,14 @@ def is_venv() -> bool:
 
     return real_prefix or base_prefix
 
+@__functools.lru_cache(maxsize=1)
 def is_frozen() -> bool:
     """
     Returns true if the application is being run from within
     a frozen Python environment
     """
 
-    import importlib
-    spec = importlib.util.find_spec(__name__)
+    spec = __importlib_util.find_spec(__name__)
     return spec is not None and spec.origin is not None
 
 def is_interactive() -> bool:
@@ -45,8 +57,7 @@ def is_interactive() -> bool:
     interactive command prompt
     """
 
-    import sys
-    return hasattr(sys, 'ps1') and hasattr(sys, 'ps2')
+    return hasattr(__sys, 'ps1') and hasattr(__sys, 'ps2')
 
 def is_developer_build() -> bool:
     """
@@ -82,6 +93,7 @@ def get_repository() -> object:
     else:
         raise AttributeError('base has no repository object')
 
+@__functools.lru_cache(maxsize=1)
 def is_panda3d_build() -> bool:
     """
     Returns true if the application is currently
@@ -90,6 +102,7 @@ def is_panda3d_build() -> bool:
 
     return is_frozen()
 
+@__functools.lru_cache(maxsize=1)
 def is_built_executable() -> bool:
     """
     Returns true if the application is currently
@@ -145,35 +158,88 @@ def __set_variable(variable_name: str, value: object) -> None:
     module = __get_module()
     setattr(module, variable_name, value)
 
+__accessor_prefixes = ('has_', 'get_', 'set_')
+__builtin_variables = vars(builtins)
+
+# Legacy Panda3d builtins provided by the ShowBase instance that are
+# exposed through the runtime module
+__legacy_builtins = frozenset({
+    'base', 'render', 'render2d', 'aspect2d', 'pixel2d', 'render2dp', 'aspect2dp',
+    'pixel2dp', 'hidden', 'camera', 'loader', 'taskMgr', 'jobMgr', 'eventMgr',
+    'messenger', 'bboard', 'ostream', 'directNotify', 'giveNotify', 'globalClock',
+    'vfs', 'cpMgr', 'cvMgr', 'pandaSystem', 'wantUberdog', 'config', 'run',
+    'deltaProfiler', 'onScreenDebug', 'inspect', '__dev__'
+})
+
+def __create_variable_accessors(variable_name: str) -> dict:
+    """
+    Creates the has_x, get_x and set_x methods for a known runtime variable.
+    Falls back to the legacy Panda3d builtins if the variable has not been set
+    """
+
+    module_variables = globals()
+
+    def get_variable() -> object:
+        if variable_name not in module_variables:
+            return __builtin_variables.get(variable_name)
+
+        return module_variables[variable_name]
+
+    def has_variable() -> bool:
+        return get_variable() is not None
+
+    def set_variable(value: object) -> None:
+        module_variables[variable_name] = value
+
+    accessors = {
+        'has_%s' % variable_name: has_variable,
+        'get_%s' % variable_name: get_variable,
+        'set_%s' % variable_name: set_variable
+    }
+
+    for accessor_name, accessor in accessors.items():
+        accessor.__name__ = accessor.__qualname__ = accessor_name
+
+    return accessors
+
+for __variable_name in __runtime_variables:
+    globals().update(__create_variable_accessors(__variable_name))
+del __variable_name
+
 def __getattr__(key: str) -> object:
     """
     Custom get attribute handler for allowing access to the has_x method names
-    of the engine runtime module. Also exposes the builtins module
-    for the legacy Panda3d builtins provided by the ShowBase instance
+    of variables not known to the engine runtime module. Also exposes the builtins module
+    for the legacy Panda3d builtins provided by the ShowBase instance.
+
+    Generated has_x, get_x and set_x methods are cached on the module so
+    that subsequent accesses bypass this handler
     """
 
-    result = None
-    is_has_method = key.startswith('has_')
-    is_get_method = key.startswith('get_')
-    is_set_method = key.startswith('set_')
+    prefix = key[:4]
+    if prefix not in __accessor_prefixes:
+        result = None
+        if key in __legacy_builtins:
+            result = __builtin_variables.get(key)
+
+        if result is None:
+            raise AttributeError('runtime module has no attribute: %s' % key)
+
+        return result
 
     if len(key) > 4:
         variable_name = key[4:]
     else:
         variable_name = key
 
-    if is_has_method:
+    if prefix == 'has_':
         result = lambda: __has_variable(variable_name)
-    elif is_get_method:
+    elif prefix == 'get_':
         result = lambda: __get_variable(variable_name)
-    elif is_set_method:
+    else:
         result = lambda value: __set_variable(variable_name, value)
-    elif hasattr(builtins, key):
-        result = getattr(builtins, key)
-
-    if not result:
-        raise AttributeError('runtime module has no attribute: %s' % key)
 
+    __set_variable(key, result)
     return result
 
 #----------------------------------------------------------------------------------------------------------------------------------#
\ No newline at end of file